@@ -1,7 +1,17 @@
 import re
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 from pydantic import BaseModel
 
+try:
+    import ahocorasick
+except ImportError:  # optional; names are then matched by re
+    ahocorasick = None
+
+try:
+    import hyperscan
+except ImportError:  # optional; only available on x86-64
+    hyperscan = None
+
 
 class Entity(BaseModel):
     start: int
@@ -29,70 +39,160 @@ class DeanonymizationResponse(BaseModel):
     original_text: str
 
 
+# Literal names, matched case-insensitively as whole words
+NAMES = ("John Smith", "Jane Doe", "Michael Johnson")
+
+# Structured data, matched with regular expressions. Overlapping matches are resolved leftmost first and, at the same
+# start, by rule order, so rules that can contain another rule's match (an email with a digit-only local part, an
+# IBAN) come before the digit-only rules.
+STRUCTURED_RULES = {
+    "EMAIL": r'\b[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}\b',  # Matches email addresses
+    "IBAN": r'\b[A-Z]{2}\d{2}[A-Z\d]{1,30}\b',  # Matches IBAN format
+    "ID_CARD": r'\b[A-Z]{2}\s\d{6,}\b',  # Matches a 2-letter and 6-digit or more ID card
+    "PHONE_NUMBER": r'\b\d{10}\b',  # Matches a 10-digit number
+    "PERSONAL_CODE": r'\b\d{13}\b',  # Matches a 13-digit number
+}
+
+# A simple, rule-based anonymization dictionary
+RULES = {
+    "NAMES": r'(?i:\b(' + "|".join(map(re.escape, NAMES)) + r')\b)',
+    **STRUCTURED_RULES,
+}
+
+# All rules merged into one alternation so the text is scanned in a single pass;
+# the matching rule is recovered from the name of the group that matched.
+_MASTER_RE = re.compile("|".join(f"(?P<{label}>{pattern})" for label, pattern in RULES.items()))
+_STRUCTURED_RE = re.compile("|".join(f"(?P<{label}>{pattern})" for label, pattern in STRUCTURED_RULES.items()))
+
+_LABELS = tuple(RULES)
+_RULE_IDS = {label: rule_id for rule_id, label in enumerate(_LABELS)}
+
+_REPLACEMENTS = {label: f"[{label}]" for label in RULES}
+
+
+def _compile_names_automaton():
+    # One Aho-Corasick automaton over the lowercased names; each word maps to its length
+    automaton = ahocorasick.Automaton()
+    for name in NAMES:
+        automaton.add_word(name.lower(), len(name))
+    automaton.make_automaton()
+    return automaton
+
+
+def _compile_hyperscan_db():
+    # Block-mode database holding every structured rule; SOM_LEFTMOST makes the scanner report start offsets too
+    db = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+    db.compile(
+        expressions=[pattern.encode() for pattern in STRUCTURED_RULES.values()],
+        ids=[_RULE_IDS[label] for label in STRUCTURED_RULES],
+        elements=len(STRUCTURED_RULES),
+        flags=[hyperscan.HS_FLAG_SOM_LEFTMOST] * len(STRUCTURED_RULES),
+    )
+    return db
+
+
+_NAMES_AUTOMATON = _compile_names_automaton() if ahocorasick is not None else None
+_HS_DB = _compile_hyperscan_db() if hyperscan is not None else None
+
+# ASCII characters that Python's \s matches but Hyperscan's does not
+_HS_UNSAFE_RE = re.compile(r'[\x1c-\x1f]')
+
+
+def _is_word_char(char: str) -> bool:
+    # Agrees with re's \w only for ASCII characters, which is all _find_name_hits is given
+    return char.isalnum() or char == "_"
+
+
+def _find_name_hits(text: str) -> List[Tuple[int, int]]:
+    """Return the (start, end) spans of the whole-word occurrences of NAMES in text."""
+    hits = []
+    for last, length in _NAMES_AUTOMATON.iter(text.lower()):
+        start, end = last - length + 1, last + 1
+        # Same word boundaries as \b in the NAMES rule
+        if (start == 0 or not _is_word_char(text[start - 1])) and (end == len(text) or not _is_word_char(text[end])):
+            hits.append((start, end))
+    return hits
+
+
+def _find_matches(text: str) -> List[Tuple[int, int, str]]:
+    """Return the non-overlapping (start, end, label) matches of all rules, leftmost first."""
+    # Lowercasing may change the length of non-ASCII text, and Hyperscan reports byte offsets and treats \b
+    # as ASCII-only, so any other text goes through re, as does everything when ahocorasick is missing
+    if _NAMES_AUTOMATON is None or not text.isascii():
+        return [(match.start(), match.end(), match.lastgroup) for match in _MASTER_RE.finditer(text)]
+
+    # Hits are (start, rule_id, -end) so that sorting them gives the order the sweep below needs
+    names_id = _RULE_IDS["NAMES"]
+    hits = [(start, names_id, -end) for start, end in _find_name_hits(text)]
+    if _HS_DB is None or _HS_UNSAFE_RE.search(text):
+        hits.extend(
+            (match.start(), _RULE_IDS[match.lastgroup], -match.end()) for match in _STRUCTURED_RE.finditer(text)
+        )
+    else:
+        _HS_DB.scan(
+            text.encode("ascii"),
+            match_event_handler=lambda rule_id, start, end, flags, context: hits.append((start, rule_id, -end)),
+        )
+
+    # Keep the hits re would, i.e. leftmost, then earliest rule, then longest
+    matches = []
+    cursor = 0
+    for start, rule_id, neg_end in sorted(hits):
+        if start >= cursor:
+            cursor = -neg_end
+            matches.append((start, cursor, _LABELS[rule_id]))
+        elif -neg_end > cursor:
+            # The scanners do not report every overlapping match, so a hit straddling the cursor may hide
+            # one that starts after it; let re resolve the rest of the text exactly
+            matches.extend((match.start(), match.end(), match.lastgroup) for match in _MASTER_RE.finditer(text, cursor))
+            break
+    return matches
+
+
 class Anonymizer:
     def __init__(self):
-        # A simple, rule-based anonymization dictionary
-        self.rules = {
-            "NAMES": re.compile(r'\b(John Smith|Jane Doe|Michael Johnson)\b', re.IGNORECASE),
-            "PHONE_NUMBER": re.compile(r'\b\d{10}\b'),  # Matches a 10-digit number
-            "PERSONAL_CODE": re.compile(r'\b\d{13}\b'),  # Matches a 13-digit number
-            "ID_CARD": re.compile(r'\b[A-Z]{2}\s\d{6,}\b'),  # Matches a 2-letter and 6-digit or more ID card
-            "EMAIL": re.compile(r'\b[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}\b'),  # Matches email addresses
-            "IBAN": re.compile(r'\b[A-Z]{2}\d{2}[A-Z\d]{1,30}\b'),  # Matches IBAN format
-        }
+        self.replacements = _REPLACEMENTS
 
     def anonymize_text(self, text: str) -> (str, List[Entity]):
-        entities = []
-        anonymized_text = text
-
-        # Find all matches for all rules
-        for label, pattern in self.rules.items():
-            for match in pattern.finditer(text):
-                entities.append({
-                    "start": match.start(),
-                    "end": match.end(),
-                    "text": match.group(0),
-                    "label": label,
-                    "replacement": f"[{label}]"
-                })
-
-        # Sort entities by start position in descending order
-        sorted_entities = sorted(entities, key=lambda e: e["start"], reverse=True)
-
-        # Perform replacements on the original text
-        for entity in sorted_entities:
-            start = entity["start"]
-            end = entity["end"]
-            replacement_text = entity["replacement"]
-            anonymized_text = anonymized_text[:start] + replacement_text + anonymized_text[end:]
-
-        # Correctly format entities to match the Pydantic model
+        # Find all matches for all rules in one scan; they come back sorted by start and never overlap
+        matches = _find_matches(text)
+
+        # Build the anonymized text left to right and join it once
+        chunks = []
+        cursor = 0
+        for start, end, label in matches:
+            chunks.append(text[cursor:start])
+            chunks.append(self.replacements[label])
+            cursor = end
+        chunks.append(text[cursor:])
+        anonymized_text = "".join(chunks)
+
+        # Matches stay plain tuples until here; entities are reported by start position in descending order.
+        # The fields come straight from the scanner, so validation is skipped.
         pydantic_entities = [
-            Entity(
-                start=e["start"],
-                end=e["end"],
-                text=e["text"],
-                label=e["label"],
-                replacement=e["replacement"]
+            Entity.model_construct(
+                start=start,
+                end=end,
+                text=text[start:end],
+                label=label,
+                replacement=self.replacements[label]
             )
-            for e in sorted_entities
+            for start, end, label in reversed(matches)
         ]
 
         return anonymized_text, pydantic_entities
 
     def deanonymize_text(self, text: str, entities: List[Dict[str, Any]]) -> str:
-        # Sort entities by start position in descending order to avoid messing up indices
-        sorted_entities = sorted(entities, key=lambda e: e["start"], reverse=True)
-
-        original_text = text
-        for entity in sorted_entities:
-            replacement_start = original_text.find(entity["replacement"])
+        # Placeholders appear in the text in the same order as their entities, so restore them in one
+        # left-to-right pass and join once
+        chunks = []
+        cursor = 0
+        for entity in sorted(entities, key=lambda e: e["start"]):
+            replacement_start = text.find(entity["replacement"], cursor)
             if replacement_start != -1:
-                replacement_end = replacement_start + len(entity["replacement"])
-                original_text = (
-                        original_text[:replacement_start] +
-                        entity["text"] +
-                        original_text[replacement_end:]
-                )
-
-        return original_text
+                chunks.append(text[cursor:replacement_start])
+                chunks.append(entity["text"])
+                cursor = replacement_start + len(entity["replacement"])
+        chunks.append(text[cursor:])
+
+        return "".join(chunks)
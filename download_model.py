@@ -3,7 +3,9 @@ from transformers import AutoTokenizer, AutoModelForTokenClassification
 MODEL_NAME = "Finguys/acta-anonymizer-financial"
 
 print(f"Downloading tokenizer for {MODEL_NAME}...")
-tokenizer = AutoTokenizer.from_pretrained(MODEL_NAME)
+tokenizer = AutoTokenizer.from_pretrained(MODEL_NAME, use_fast=True)
+if not tokenizer.is_fast:
+    raise RuntimeError(f"No fast (Rust) tokenizer is available for {MODEL_NAME}.")
 print("Tokenizer downloaded successfully.")
 
 print(f"Downloading model for {MODEL_NAME}...")
@@ -9,6 +9,7 @@ from typing import List, Dict, Any
 import requests
 import cohere
 import re
+import uvicorn
 
 # Initialize the FastAPI app
 app = FastAPI()
@@ -17,66 +18,80 @@ app = FastAPI()
 app.mount("/static", StaticFiles(directory="static"), name="static")
 
 
+# Example regex for different types of financial/personal data. Overlapping matches are resolved leftmost first and,
+# at the same start, by pattern order, so patterns that can contain another pattern's match (an email with a
+# digit-only local part, an IBAN) come before the digit-only ones.
+PATTERNS = {
+    "EMAIL_ADDRESS": r"\b[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}\b",
+    "IBAN": r"\b[A-Z]{2}[0-9A-Z]{2}[0-9A-Z]{12,30}\b",
+    "ID_CARD": r"\b[A-Z]{2}\s?\d{6,7}\b",
+    "PHONE_NUMBER": r"(\b\d{10,12}\b)",
+    "PERSONAL_CODE": r"\b\d{13}\b",
+    "NAME": r"\b[A-Z][a-z]+(?: [A-Z][a-z]+)+\b"
+}
+
+# Single alternation over all patterns, compiled once; the entity type is the name of the matching group
+_MASTER_RE = re.compile("|".join(f"(?P<{entity_type}>{pattern})" for entity_type, pattern in PATTERNS.items()))
+
+
+# Placeholders produced by anonymize_text, e.g. [EMAIL_ADDRESS_0]
+_PLACEHOLDER_RE = re.compile(r"\[[A-Z_]+_\d+\]")
+
+
 # Anonymization/Deanonymization logic
 class Anonymizer:
     def anonymize_text(self, text: str):
         entities = []
-        # Example regex for different types of financial/personal data
-        patterns = {
-            "PHONE_NUMBER": r"(\b\d{10,12}\b)",
-            "IBAN": r"\b[A-Z]{2}[0-9A-Z]{2}[0-9A-Z]{12,30}\b",
-            "EMAIL_ADDRESS": r"\b[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}\b",
-            "ID_CARD": r"\b[A-Z]{2}\s?\d{6,7}\b",
-            "PERSONAL_CODE": r"\b\d{13}\b",
-            "NAME": r"\b[A-Z][a-z]+(?: [A-Z][a-z]+)+\b"
-        }
-
-        # Collect all matches and sort them in reverse order to avoid index issues
-        matches = []
-        for entity_type, pattern in patterns.items():
-            for match in re.finditer(pattern, text):
-                matches.append({
-                    "entity_type": entity_type,
-                    "original_text": match.group(0),
-                    "start": match.start(),
-                    "end": match.end()
-                })
-
-        matches.sort(key=lambda x: x['start'], reverse=True)
-
-        anonymized_text = text
+
+        # Collect all matches in one pass; they come back sorted by start and never overlap
+        matches = list(_MASTER_RE.finditer(text))
+
+        # Build the output left to right and join once, numbering the matches from the end of the text
+        chunks = []
+        cursor = 0
         for i, match in enumerate(matches):
-            unique_id = f"[{match['entity_type']}_{i}]"
-            anonymized_text = anonymized_text[:match['start']] + unique_id + anonymized_text[match['end']:]
+            entity_type = match.lastgroup
+            unique_id = f"[{entity_type}_{len(matches) - 1 - i}]"
+            chunks.append(text[cursor:match.start()])
+            chunks.append(unique_id)
+            cursor = match.end()
 
             # Store entities in the correct dictionary format for the response
             entities.append({
                 "unique_id": unique_id,
-                "original_text": match['original_text'],
-                "entity_type": match['entity_type']
+                "original_text": match.group(0),
+                "entity_type": entity_type
             })
+        chunks.append(text[cursor:])
+        anonymized_text = "".join(chunks)
+        entities.reverse()
 
         return anonymized_text, entities
 
     def deanonymize_text(self, anonymized_text: str, entities: List[Dict[str, str]]):
-        deanonymized_text = anonymized_text
+        # The first entity wins when a unique_id is repeated
+        originals = {}
         for entity in entities:
-            unique_id = entity["unique_id"]
-            original_text = entity["original_text"]
-            deanonymized_text = deanonymized_text.replace(unique_id, original_text)
-        return deanonymized_text
+            originals.setdefault(entity["unique_id"], entity["original_text"])
+
+        # Swap every placeholder in a single scan, leaving unknown ones untouched
+        return _PLACEHOLDER_RE.sub(lambda match: originals.get(match.group(0), match.group(0)), anonymized_text)
 
 
 anonymizer = Anonymizer()
 
 
+# One Cohere client per process so its connection pool is reused across requests
+COHERE_API_KEY = os.environ.get("COHERE_API_KEY")
+_cohere = cohere.AsyncClient(COHERE_API_KEY) if COHERE_API_KEY else None
+
+
 # Cohere API logic with exponential backoff
 async def get_cohere_analysis(text: str):
-    api_key = "XwLPqRhafzxz1bOdpLOlaCRvRqzVbKlpknGBrRxV"
-    if not api_key:
+    if _cohere is None:
         raise HTTPException(status_code=500, detail="COHERE_API_KEY environment variable not set.")
 
-    co = cohere.AsyncClient(api_key)
+    co = _cohere
     retries = 5
     delay = 1
 
@@ -109,6 +124,14 @@ class AnonymizeResponse(BaseModel):
     entities: List[Dict[str, str]]
 
 
+class BatchAnonymizeRequest(BaseModel):
+    texts: List[str]
+
+
+class BatchAnonymizeResponse(BaseModel):
+    results: List[AnonymizeResponse]
+
+
 class DeanonymizeRequest(BaseModel):
     text: str
     entities: List[Dict[str, str]]
@@ -142,11 +165,34 @@ async def anonymize_text_endpoint(request: AnonymizeRequest):
     return {"anonymized_text": anonymized_text, "entities": entities_list}
 
 
+# Plain def so FastAPI runs this CPU-bound loop in its threadpool instead of blocking the event loop
+@app.post("/api/anonymize/batch", response_model=BatchAnonymizeResponse)
+def anonymize_batch_endpoint(request: BatchAnonymizeRequest):
+    if not isinstance(request.texts, list):
+        raise HTTPException(status_code=400, detail="Input 'texts' must be a list of strings.")
+
+    # Anonymize every text in one call, sparing clients a round trip per text
+    results = []
+    for text in request.texts:
+        anonymized_text, entities_list = anonymizer.anonymize_text(text)
+        results.append({"anonymized_text": anonymized_text, "entities": entities_list})
+
+    return {"results": results}
+
+
 @app.post("/api/deanonymize", response_model=DeanonymizeResponse)
 async def deanonymize_text_endpoint(request: DeanonymizeRequest):
     if not isinstance(request.text, str) or not isinstance(request.entities, list):
         raise HTTPException(status_code=400, detail="Input 'text' must be a string and 'entities' must be a list.")
 
+    # Only placeholders in the format anonymize_text produces can be restored
+    for entity in request.entities:
+        if not _PLACEHOLDER_RE.fullmatch(entity.get("unique_id", "")):
+            raise HTTPException(
+                status_code=400,
+                detail=f"Entity 'unique_id' {entity.get('unique_id')!r} is not a placeholder like '[EMAIL_ADDRESS_0]'."
+            )
+
     original_text = anonymizer.deanonymize_text(request.text, request.entities)
 
     return {"original_text": original_text}
@@ -160,3 +206,13 @@ async def cohere_analyze_endpoint(request: AnonymizeRequest):
     analysis_text = await get_cohere_analysis(request.text)
 
     return {"analysis": analysis_text}
+
+
+if __name__ == "__main__":
+    # Anonymization is CPU-bound, so run one worker process per core
+    uvicorn.run(
+        "fastapi_app:app",
+        host=os.environ.get("HOST", "127.0.0.1"),
+        port=8000,
+        workers=int(os.environ.get("WEB_CONCURRENCY", os.cpu_count() or 1)),
+    )
@@ -0,0 +1,84 @@
+import platform
+import random
+
+import pytest
+
+import anonymizer_hybrid
+
+TOKENS = [
+    "John Smith", "jane doe", "JOHN SMITHx", "Michael Johnson", "0123456789", "1234567890123", "AB 123456",
+    "AB\x1c123456", "a.b@x.co.uk", "RO49AAAA1B31007593840000", "AB12CD@x.com", "1234567890@bank.com",
+    "Jane Doe@x.com", "john smith.b@ex.org", "AB12", "foo", "12", "x", "_", "-", ".", "@", "\x1f", "\t", "Ştefan",
+]
+
+
+def _reference_matches(text):
+    return [(match.start(), match.end(), match.lastgroup) for match in anonymizer_hybrid._MASTER_RE.finditer(text)]
+
+
+def _random_texts(count, seed=0):
+    rng = random.Random(seed)
+    for _ in range(count):
+        separator = " " if rng.random() < 0.5 else ""
+        yield separator.join(rng.choice(TOKENS + [" "]) for _ in range(rng.randint(1, 10)))
+
+
+@pytest.fixture(params=["automaton+hyperscan", "automaton+re", "re"])
+def scanner(request, monkeypatch):
+    if "automaton" in request.param:
+        if anonymizer_hybrid._NAMES_AUTOMATON is None:
+            pytest.skip("ahocorasick is not installed")
+    else:
+        monkeypatch.setattr(anonymizer_hybrid, "_NAMES_AUTOMATON", None)
+    if "hyperscan" in request.param:
+        if anonymizer_hybrid._HS_DB is None:
+            # requirements.txt installs hyperscan on x86-64, so only other platforms may skip the Hyperscan path
+            if platform.machine() == "x86_64":
+                pytest.fail("hyperscan is not installed, so the Hyperscan scanner would go untested")
+            pytest.skip(f"hyperscan is not available on {platform.machine()}; the Hyperscan scanner is untested")
+    else:
+        monkeypatch.setattr(anonymizer_hybrid, "_HS_DB", None)
+    return request.param
+
+
+@pytest.mark.parametrize("text", [
+    "",
+    "John Smith called 0123456789",
+    "JOHN SMITH, jane doe_x, xjane doe, Michael Johnson",
+    "Jane Doe@x.com",
+    "AB\x1c123456",
+    "mail 0712345678@yahoo.com",
+    "RO49AAAA1B31007593840000@x.com",
+    "12@AB12CD@x.coma.b@x.co.ukjane doefoo@barjane doe12",
+])
+def test_find_matches_edge_cases(scanner, text):
+    assert anonymizer_hybrid._find_matches(text) == _reference_matches(text)
+
+
+def test_find_name_hits_respects_word_boundaries():
+    if anonymizer_hybrid._NAMES_AUTOMATON is None:
+        pytest.skip("ahocorasick is not installed")
+    assert anonymizer_hybrid._find_name_hits("john smith_ xjane doe JANE DOE.") == [(22, 30)]
+
+
+def test_find_matches_agrees_with_master_re(scanner):
+    for text in _random_texts(20000):
+        assert anonymizer_hybrid._find_matches(text) == _reference_matches(text), text
+
+
+def test_deanonymize_text_round_trip():
+    anonymizer = anonymizer_hybrid.Anonymizer()
+    text = "John Smith: a@x.com, b@y.com, 0123456789"
+    anonymized_text, entities = anonymizer.anonymize_text(text)
+
+    assert anonymized_text == "[NAMES]: [EMAIL], [EMAIL], [PHONE_NUMBER]"
+    assert anonymizer.deanonymize_text(anonymized_text, [entity.model_dump() for entity in entities]) == text
+
+
+def test_deanonymize_text_skips_missing_placeholders():
+    entities = [
+        {"start": 0, "end": 7, "text": "a@x.com", "label": "EMAIL", "replacement": "[EMAIL]"},
+        {"start": 8, "end": 18, "text": "0123456789", "label": "PHONE_NUMBER", "replacement": "[PHONE_NUMBER]"},
+    ]
+
+    assert anonymizer_hybrid.Anonymizer().deanonymize_text("[EMAIL] and more", entities) == "a@x.com and more"
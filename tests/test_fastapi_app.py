@@ -0,0 +1,125 @@
+import pytest
+from fastapi.testclient import TestClient
+
+import fastapi_app
+
+
+@pytest.fixture
+def anonymizer():
+    return fastapi_app.Anonymizer()
+
+
+@pytest.fixture
+def client():
+    return TestClient(fastapi_app.app)
+
+
+@pytest.mark.parametrize("text, entity_type", [
+    ("1234567890@bank.com", "EMAIL_ADDRESS"),
+    ("1234567890123@bank.ro", "EMAIL_ADDRESS"),
+    ("RO49AAAA1B31007593840000@bank.ro", "EMAIL_ADDRESS"),
+])
+def test_anonymize_text_containing_pattern_wins_overlap(anonymizer, text, entity_type):
+    anonymized_text, entities = anonymizer.anonymize_text(text)
+
+    assert anonymized_text == f"[{entity_type}_0]"
+    assert entities == [{"unique_id": f"[{entity_type}_0]", "original_text": text, "entity_type": entity_type}]
+
+
+def test_anonymize_text_without_overlaps(anonymizer):
+    anonymized_text, entities = anonymizer.anonymize_text(
+        "Ion Popescu paid RO49AAAA1B31007593840000 from 0722123456, contact ion.p@bank.ro, "
+        "ID AB 123456, CNP 1850101123456"
+    )
+
+    assert anonymized_text == (
+        "[NAME_5] paid [IBAN_4] from [PHONE_NUMBER_3], contact [EMAIL_ADDRESS_2], "
+        "ID [ID_CARD_1], CNP [PERSONAL_CODE_0]"
+    )
+    assert [(entity["entity_type"], entity["original_text"]) for entity in entities] == [
+        ("PERSONAL_CODE", "1850101123456"),
+        ("ID_CARD", "AB 123456"),
+        ("EMAIL_ADDRESS", "ion.p@bank.ro"),
+        ("PHONE_NUMBER", "0722123456"),
+        ("IBAN", "RO49AAAA1B31007593840000"),
+        ("NAME", "Ion Popescu"),
+    ]
+
+
+def test_anonymize_text_without_matches(anonymizer):
+    assert anonymizer.anonymize_text("nothing to hide") == ("nothing to hide", [])
+
+
+def test_anonymize_text_numbers_from_end_and_lists_entities_descending(anonymizer):
+    # Wire format kept from the original implementation: the last match in the text is _0, and entities are
+    # listed from the end of the text to the start
+    anonymized_text, entities = anonymizer.anonymize_text("Call 0722123456, then 0733123456 and 0744123456")
+
+    assert anonymized_text == "Call [PHONE_NUMBER_2], then [PHONE_NUMBER_1] and [PHONE_NUMBER_0]"
+    assert entities == [
+        {"unique_id": "[PHONE_NUMBER_0]", "original_text": "0744123456", "entity_type": "PHONE_NUMBER"},
+        {"unique_id": "[PHONE_NUMBER_1]", "original_text": "0733123456", "entity_type": "PHONE_NUMBER"},
+        {"unique_id": "[PHONE_NUMBER_2]", "original_text": "0722123456", "entity_type": "PHONE_NUMBER"},
+    ]
+
+
+def test_anonymize_batch_matches_single_endpoint(client):
+    texts = ["Ion Popescu 0722123456", "", "nothing to hide", "1234567890@bank.com and RO49AAAA1B31007593840000"]
+
+    response = client.post("/api/anonymize/batch", json={"texts": texts})
+
+    assert response.status_code == 200
+    assert response.json()["results"] == [
+        client.post("/api/anonymize", json={"text": text}).json() for text in texts
+    ]
+
+
+def test_anonymize_batch_empty(client):
+    response = client.post("/api/anonymize/batch", json={"texts": []})
+
+    assert response.status_code == 200
+    assert response.json() == {"results": []}
+
+
+def _entity(unique_id, original_text, entity_type="X"):
+    return {"unique_id": unique_id, "original_text": original_text, "entity_type": entity_type}
+
+
+def test_deanonymize_text_round_trip(anonymizer):
+    text = "Ion Popescu: 0722123456, 0733123456, ion.p@bank.ro"
+
+    assert anonymizer.deanonymize_text(*anonymizer.anonymize_text(text)) == text
+
+
+def test_deanonymize_text_placeholder_prefixes(anonymizer):
+    entities = [_entity("[X_1]", "one"), _entity("[X_10]", "ten")]
+
+    assert anonymizer.deanonymize_text("[X_10] [X_1] [X_10]", entities) == "ten one ten"
+
+
+def test_deanonymize_text_first_repeated_id_wins(anonymizer):
+    entities = [_entity("[X_1]", "first"), _entity("[X_1]", "second")]
+
+    assert anonymizer.deanonymize_text("a [X_1] b", entities) == "a first b"
+
+
+def test_deanonymize_text_leaves_unknown_placeholders(anonymizer):
+    assert anonymizer.deanonymize_text("[X_1] [Y_2]", [_entity("[X_1]", "one")]) == "one [Y_2]"
+
+
+@pytest.mark.parametrize("unique_id", ["<<p1>>", "[name_1]", "[X_1] "])
+def test_deanonymize_endpoint_rejects_foreign_placeholders(client, unique_id):
+    response = client.post("/api/deanonymize", json={"text": unique_id, "entities": [_entity(unique_id, "secret")]})
+
+    assert response.status_code == 400
+
+
+def test_deanonymize_endpoint_restores_placeholders(client):
+    anonymized = client.post("/api/anonymize", json={"text": "Ion Popescu 0722123456"}).json()
+
+    response = client.post(
+        "/api/deanonymize", json={"text": anonymized["anonymized_text"], "entities": anonymized["entities"]}
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {"original_text": "Ion Popescu 0722123456"}